@@ -88,10 +88,12 @@ class BotClient:
             channel = grpc.aio.insecure_channel(f'{host}:{port}')
             stub = arena_pb2_grpc.ArenaBattleServiceStub(channel)
             
-            # Register for PvP matchmaking with FULL bot name
+            # Register into the requested room
             registration = arena_pb2.BotRegistration(
                 player_id=self.player_id,
-                bot_name=f"{self.bot_name}|{self.room_id}|{self.room_password}"
+                bot_name=self.bot_name,
+                room_id=self.room_id,
+                room_password=self.room_password
             )
             
             logger.info(f"🤖 Registering smart combat bot: {self.bot_name}")
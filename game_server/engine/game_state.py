@@ -53,8 +53,8 @@ class DummyBot(Bot):
             self.stuck_counter = 0
         
         # Check if stuck
-        dist_moved = math.sqrt((self.x - self.last_pos[0])**2 + (self.y - self.last_pos[1])**2)
-        if dist_moved < 1.0:  # Tăng ngưỡng từ 0.5 lên 1.0
+        dist_moved_sq = (self.x - self.last_pos[0])**2 + (self.y - self.last_pos[1])**2
+        if dist_moved_sq < 1.0:  # Tăng ngưỡng từ 0.5 lên 1.0
             self.stuck_counter = getattr(self, 'stuck_counter', 0) + 1
         else:
             self.stuck_counter = 0
@@ -347,21 +347,21 @@ class GameState:
         
         if enemies:
             closest_enemy = min(enemies, 
-                key=lambda e: math.sqrt((e.x - bot.x)**2 + (e.y - bot.y)**2))
+                key=lambda e: (e.x - bot.x)**2 + (e.y - bot.y)**2)
             enemy_pos = (closest_enemy.x, closest_enemy.y)
             enemy_hp = closest_enemy.hp
             has_line_of_sight = self._has_line_of_sight(
                 (bot.x, bot.y), (closest_enemy.x, closest_enemy.y)
             )
         
-        # Get nearby bullets (within 300 pixels)
+        # Get nearby bullets (within 300 pixels) as a flat (N, 2) float32 array
         nearby_bullets = []
         for bullet in self.bullets:
             dx = bullet.x - bot.x
             dy = bullet.y - bot.y
-            distance = math.sqrt(dx*dx + dy*dy)
-            if distance <= 300:
-                nearby_bullets.append({'x': bullet.x, 'y': bullet.y})
+            if dx*dx + dy*dy <= 300 * 300:
+                nearby_bullets.append((bullet.x, bullet.y))
+        bullet_xy = np.asarray(nearby_bullets, dtype=np.float32).reshape(-1, 2)
         
         # Serialize walls
         wall_data = []
@@ -374,7 +374,7 @@ class GameState:
             'self_hp': bot.hp,
             'enemy_pos': {'x': enemy_pos[0], 'y': enemy_pos[1]},
             'enemy_hp': enemy_hp,
-            'bullets': nearby_bullets,
+            'bullets': bullet_xy,
             'walls': wall_data,
             'has_line_of_sight': has_line_of_sight,
             'arena_width': self.width,
@@ -125,9 +125,9 @@ class PhysicsEngine:
                 # Check collision
                 dx = bullet.x - bot.x
                 dy = bullet.y - bot.y
-                distance = math.sqrt(dx*dx + dy*dy)
+                hit_distance = bullet.radius + bot.radius
                 
-                if distance < bullet.radius + bot.radius:
+                if dx*dx + dy*dy < hit_distance * hit_distance:
                     # Hit!
                     self._damage_bot(bot, bullet.damage, bullet.shooter_id)
                     bullets_to_remove.append(bullet)
@@ -147,11 +147,12 @@ class PhysicsEngine:
                 
                 dx = bot2.x - bot1.x
                 dy = bot2.y - bot1.y
-                distance = math.sqrt(dx*dx + dy*dy)
+                distance_sq = dx*dx + dy*dy
                 min_distance = bot1.radius + bot2.radius
                 
-                if distance < min_distance and distance > 0:
+                if 0 < distance_sq < min_distance * min_distance:
                     # Collision! Separate bots
+                    distance = math.sqrt(distance_sq)
                     overlap = min_distance - distance
                     separation = overlap / 2
                     
@@ -257,9 +258,9 @@ class PhysicsEngine:
         bot.vel_y += thrust_y * self.bot_acceleration * (1/60)
         
         # Limit speed
-        speed = math.sqrt(bot.vel_x**2 + bot.vel_y**2)
-        if speed > self.max_bot_speed:
-            factor = self.max_bot_speed / speed
+        speed_sq = bot.vel_x**2 + bot.vel_y**2
+        if speed_sq > self.max_bot_speed * self.max_bot_speed:
+            factor = self.max_bot_speed / math.sqrt(speed_sq)
             bot.vel_x *= factor
             bot.vel_y *= factor
         
@@ -13,8 +13,8 @@ Usage:
     logger.close()
 """
 
-from .json_logger import ServerJSONLogger, observation_to_dict, action_to_dict
+from .json_logger import ServerJSONLogger, QueuedServerJSONLogger, observation_to_dict, action_to_dict
 
-__all__ = ['ServerJSONLogger', 'observation_to_dict', 'action_to_dict']
+__all__ = ['ServerJSONLogger', 'QueuedServerJSONLogger', 'observation_to_dict', 'action_to_dict']
 
 __version__ = "1.0.0"
\ No newline at end of file
@@ -1,5 +1,6 @@
 import json
 import time
+import queue
 import threading
 from pathlib import Path
 from datetime import datetime
@@ -171,6 +172,40 @@ class ServerJSONLogger:
                 self.current_file_handle.close()
                 logger.info(f"📁 Server JSON Logger closed: {self.current_file} ({self.entry_count} entries)")
 
+class QueuedServerJSONLogger(ServerJSONLogger):
+    """
+    ServerJSONLogger với background writer thread
+    log_* chỉ build entry rồi put vào queue - json.dump và file I/O chạy ngoài event loop
+    """
+    
+    _STOP = object()
+    
+    def __init__(self, log_dir: str = "logs/server_grpc", rotation_minutes: int = 5):
+        super().__init__(log_dir=log_dir, rotation_minutes=rotation_minutes)
+        
+        self._queue = queue.SimpleQueue()
+        self._writer = threading.Thread(target=self._drain, name="json-log-writer", daemon=True)
+        self._writer.start()
+    
+    def _write_entry(self, entry: Dict[str, Any]):
+        """Queue entry for the writer thread"""
+        self._queue.put_nowait(entry)
+    
+    def _drain(self):
+        """Writer thread: write queued entries until close()"""
+        while True:
+            entry = self._queue.get()
+            if entry is self._STOP:
+                break
+            super()._write_entry(entry)
+    
+    def close(self):
+        """Flush pending entries, stop writer and close current file"""
+        if self._writer.is_alive():
+            self._queue.put_nowait(self._STOP)
+            self._writer.join()
+        super().close()
+
 # Utility functions để convert protobuf messages
 def observation_to_dict(observation) -> Dict[str, Any]:
     """Convert protobuf observation to dictionary"""
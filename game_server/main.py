@@ -35,6 +35,8 @@ class GameEngine:
         self.physics = PhysicsEngine(self.game_state)
         self.running = False
         self.last_time = time.time()
+        # room_id -> số lần room đã được update physics; renderer so sánh để biết room đang xem có đổi không
+        self.room_versions = {}
         
         self.match_active = False
         self.active_player_count = 0
@@ -144,21 +146,13 @@ class GameEngine:
         return self.room_states[room_id]
     
     def get_all_room_states(self):
-        """Get all room states with debug info"""
-        print(f"🔍 GET_ALL: Returning {len(self.room_states)} room states")
-        print(f"🔍 GET_ALL: Keys: {list(self.room_states.keys())}")
+        """Get all room states"""
+        logger.debug("🔍 GET_ALL: Returning %d room states: %s", len(self.room_states), list(self.room_states))
         return self.room_states
     
     def get_room_state(self, room_id):
-        """Get specific room state with debug info"""
-        exists = room_id in self.room_states
-        
-        if exists:
-            state = self.room_states[room_id]
-            wall_count = len(state.walls)
-            return state
-        else:
-            return None
+        """Get specific room state (called by the renderer every frame)"""
+        return self.room_states.get(room_id)
     
     async def run(self):
         """Main game loop with multi-room physics"""
@@ -178,9 +172,11 @@ class GameEngine:
                 if total_bots >= 2:
                     # Active room - full physics
                     self.physics_engines[room_id].update(min(dt, 0.1))
+                    self.room_versions[room_id] = self.room_versions.get(room_id, 0) + 1
                 elif total_bots > 0:
                     # Waiting room - slow physics
                     self.physics_engines[room_id].update(min(dt, 0.1) * 0.1)
+                    self.room_versions[room_id] = self.room_versions.get(room_id, 0) + 1
             
             # Control game speed - MUST yield control to other tasks
             sleep_time = 1/60 / self.game_state.speed_multiplier  
@@ -3,6 +3,7 @@ import grpc
 import logging
 import sys
 import os
+import time
 from typing import Dict, Set
 from concurrent import futures
 
@@ -22,10 +23,84 @@ except ImportError as e:
 from .room_manager import RoomManager
 from game_server.engine.game_state import DummyBot
 # Import JSON logger
-from ..logging.json_logger import ServerJSONLogger, observation_to_dict, action_to_dict
+from ..logging.json_logger import QueuedServerJSONLogger, observation_to_dict, action_to_dict
 
 logger = logging.getLogger(__name__)
 
+# Hot-path message classes, resolved once instead of per observation
+_Observation = arena_pb2.Observation
+_Vec2 = arena_pb2.Vec2
+
+# Observations with more bullets than this are serialized off the event loop
+# (~12 bytes per bullet on the wire, so roughly 4 KB)
+LARGE_OBSERVATION_BULLETS = 300
+
+def build_observation(obs_data: dict):
+    """Build Observation from GameState.get_observation() data.
+
+    Self-contained 60 Hz hot path: only touches its argument and the bound
+    message classes, so it can be compiled (e.g. Cython pure-Python mode)
+    without changes to the servicer.
+    """
+    Vec2 = _Vec2
+    self_pos = obs_data['self_pos']
+    enemy_pos = obs_data['enemy_pos']
+    observation = _Observation(
+        tick=obs_data['tick'],
+        self_pos=Vec2(x=self_pos['x'], y=self_pos['y']),
+        self_hp=obs_data['self_hp'],
+        enemy_pos=Vec2(x=enemy_pos['x'], y=enemy_pos['y']),
+        enemy_hp=obs_data['enemy_hp'],
+        has_line_of_sight=obs_data['has_line_of_sight'],
+        arena_width=obs_data['arena_width'],
+        arena_height=obs_data['arena_height']
+    )
+    
+    # Add bullets and walls
+    bullets_add = observation.bullets.add
+    for x, y in obs_data['bullets'].tolist():
+        bullets_add(x=x, y=y)
+    observation.walls.extend(obs_data['walls'])
+    return observation
+
+def _serialize_observation(observation) -> bytes:
+    """PlayGame response serializer - passes pre-serialized bytes through.
+
+    Observation is proto3 (no required fields), so the IsInitialized() walk done
+    by SerializeToString is skipped.
+    """
+    if isinstance(observation, bytes):
+        return observation
+    return observation.SerializePartialToString()
+
+class _HandlerCapture:
+    """Stand-in server that records the generated handler table instead of registering it"""
+    def __init__(self):
+        self.handlers = None
+
+    def add_generic_rpc_handlers(self, generic_handlers):
+        pass
+
+    def add_registered_method_handlers(self, service_name, method_handlers):
+        self.handlers = method_handlers
+
+def _add_servicer_to_server(servicer, server):
+    """Generated add_ArenaBattleServiceServicer_to_server, with only PlayGame's
+    serializer swapped so it accepts observations already serialized in an executor"""
+    capture = _HandlerCapture()
+    arena_pb2_grpc.add_ArenaBattleServiceServicer_to_server(servicer, capture)
+    rpc_method_handlers = dict(capture.handlers)
+    play_game = rpc_method_handlers['PlayGame']
+    rpc_method_handlers['PlayGame'] = grpc.stream_stream_rpc_method_handler(
+        play_game.stream_stream,
+        request_deserializer=play_game.request_deserializer,
+        response_serializer=_serialize_observation,
+    )
+    generic_handler = grpc.method_handlers_generic_handler(
+        'arena.ArenaBattleService', rpc_method_handlers)
+    server.add_generic_rpc_handlers((generic_handler,))
+    server.add_registered_method_handlers('arena.ArenaBattleService', rpc_method_handlers)
+
 class BotConnection:
     """Represents a connected bot client with timing info"""
     def __init__(self, bot_id: int, player_id: str, room_id: str):
@@ -33,8 +108,9 @@ class BotConnection:
         self.player_id = player_id
         self.room_id = room_id  # Changed from match_id
         self.is_active = True
-        self.last_action_time = asyncio.get_event_loop().time()
-        self.connection_time = asyncio.get_event_loop().time()
+        now = time.monotonic()
+        self.last_action_time = now
+        self.connection_time = now
 
 class ArenaBattleServicer(arena_pb2_grpc.ArenaBattleServiceServicer):
     """gRPC service với JSON logging cho tất cả gRPC data"""
@@ -54,7 +130,8 @@ class ArenaBattleServicer(arena_pb2_grpc.ArenaBattleServiceServicer):
         # Initialize JSON logger
         self.json_logger = None
         if enable_logging:
-            self.json_logger = ServerJSONLogger(
+            # Writes happen on a background thread, off the event loop
+            self.json_logger = QueuedServerJSONLogger(
                 log_dir="logs/server_grpc_data", 
                 rotation_minutes=5
             )
@@ -63,21 +140,25 @@ class ArenaBattleServicer(arena_pb2_grpc.ArenaBattleServiceServicer):
         """Register bot with JSON logging"""
         try:
             player_id = request.player_id
-            bot_name = request.bot_name
+            actual_bot_name = request.bot_name
+            room_id = request.room_id
+            room_password = request.room_password
             
-            logger.info(f"🤖 Bot registration request: {player_id} ({bot_name})")
+            logger.info("🤖 Bot registration request: %s (%s)", player_id, actual_bot_name)
             
-            # Parse room info from bot_name hack
-            parts = bot_name.split('|')
-            if len(parts) == 3:
-                actual_bot_name, room_id, room_password = parts
-            else:
+            # Legacy clients pack room info into bot_name as "name|room|password"
+            if not room_id:
+                parts = actual_bot_name.split('|')
+                if len(parts) == 3:
+                    actual_bot_name, room_id, room_password = parts
+            
+            if not room_id:
                 if self.json_logger:
                     self.json_logger.log_bot_registration(
-                        player_id, bot_name, 0, False, "❌ Invalid room connection format"
+                        player_id, actual_bot_name, 0, False, "❌ Missing room_id"
                     )
                 return arena_pb2.RegistrationResponse(
-                    success=False, message="❌ Invalid room connection format", bot_id=0
+                    success=False, message="❌ Missing room_id", bot_id=0
                 )
 
             room_result = self.room_manager.join_room(player_id, actual_bot_name, room_id, room_password)
@@ -96,30 +177,32 @@ class ArenaBattleServicer(arena_pb2_grpc.ArenaBattleServiceServicer):
             room_state = self.game_engine.get_or_create_room_state(room_id, room_result['arena_config'])
             
             # ⭐ Debug: Log before adding bot
-            logger.info(f"🔍 DEBUG: About to add bot {player_id} with bot_id={room_result['bot_id']}")
-            logger.info(f"🔍 DEBUG: Room state before add: {len(room_state.bots)} bots")
+            logger.info("🔍 DEBUG: About to add bot %s with bot_id=%s", player_id, room_result['bot_id'])
+            logger.info("🔍 DEBUG: Room state before add: %d bots", len(room_state.bots))
             
             # ⭐ FIX: Always add AI bot FIRST
             bot_id = room_result['bot_id']
             room_state.add_bot(player_id, actual_bot_name, room_result['arena_config'], room_id, bot_id)
             
-            logger.info(f"🔍 DEBUG: Room state after add AI bot: {len(room_state.bots)} bots")
-            logger.info(f"🔍 DEBUG: Bot IDs in room: {list(room_state.bots.keys())}")
+            logger.info("🔍 DEBUG: Room state after add AI bot: %d bots", len(room_state.bots))
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("🔍 DEBUG: Bot IDs in room: %s", list(room_state.bots.keys()))
             
             # ⭐ Then spawn dummy bots if PvE room
             room_info = self.room_manager.get_room_info(room_id)
             if room_info.get('player_count', 0) == 1:  # First player in room
                 room = self.room_manager.rooms.get(room_id)
                 if room and room.is_pve_mode:
-                    logger.info(f"🎯 PvE room detected - spawning {room.initial_dummy_count} dummy bots")
+                    logger.info("🎯 PvE room detected - spawning %d dummy bots", room.initial_dummy_count)
                     self.room_manager.spawn_initial_dummy_bots(room_id, room_state)
-                    logger.info(f"🔍 DEBUG: After dummy spawn: {len(room_state.bots)} bots")
+                    logger.info("🔍 DEBUG: After dummy spawn: %d bots", len(room_state.bots))
             
-            logger.info(f"🔍 Final bot count in room {room_id}: {len(room_state.bots)}")
-            logger.info(f"🔍 Final bot details:")
-            for bid, bot in room_state.bots.items():
-                bot_type = "DUMMY" if isinstance(bot, DummyBot) else "AI"
-                logger.info(f"   Bot {bid}: {bot.name} ({bot_type})")
+            logger.info("🔍 Final bot count in room %s: %d", room_id, len(room_state.bots))
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("🔍 Final bot details:")
+                for bid, bot in room_state.bots.items():
+                    bot_type = "DUMMY" if isinstance(bot, DummyBot) else "AI"
+                    logger.info("   Bot %s: %s (%s)", bid, bot.name, bot_type)
             players_count = room_result['players_in_room']
             max_players = room_result.get('max_players', 4)  # fallback to 4
             
@@ -143,9 +226,9 @@ class ArenaBattleServicer(arena_pb2_grpc.ArenaBattleServiceServicer):
                 })
             
             # Log registration success
-            logger.info(f"✅ {player_id} registered → Bot ID: {bot_id}")
-            logger.info(f"🏠 Room: {room_result['room_id']} ({room_result['players_in_room']} players)")
-            logger.info(f"🎯 Status: {room_result['message']}")
+            logger.info("✅ %s registered → Bot ID: %s", player_id, bot_id)
+            logger.info("🏠 Room: %s (%d players)", room_result['room_id'], room_result['players_in_room'])
+            logger.info("🎯 Status: %s", room_result['message'])
             
             return arena_pb2.RegistrationResponse(
                 success=True,
@@ -199,12 +282,6 @@ class ArenaBattleServicer(arena_pb2_grpc.ArenaBattleServiceServicer):
             
             # Get room info
             player_room_id = self.room_manager.player_to_room.get(player_id, "")
-            
-            # ⭐ FIX: Skip room check for dummy bots
-            if player_id.startswith("dummy_"):
-                logger.debug(f"🤖 Dummy bot {player_id} - skip room tracking")
-                return  # Dummy bots don't need PlayGame connection
-            
             room_info = self.room_manager.get_room_info(player_room_id)
             if 'error' in room_info:
                 logger.error(f"⚠️ No room found for player {player_id}")
@@ -243,7 +320,7 @@ class ArenaBattleServicer(arena_pb2_grpc.ArenaBattleServiceServicer):
             try:
                 async for action_request in request_iterator:
                     await self._process_action_with_logging(action_request, bot_id, player_id)
-                    bot_connection.last_action_time = asyncio.get_event_loop().time()
+                    bot_connection.last_action_time = time.monotonic()
                     
             except Exception as e:
                 logger.error(f"💥 Action processing error for bot {bot_id}: {e}")
@@ -316,10 +393,13 @@ class ArenaBattleServicer(arena_pb2_grpc.ArenaBattleServiceServicer):
     async def _send_observations_with_logging(self, connection: BotConnection, context):
         """Send observations with IMPROVED waiting logic"""
         try:
+            loop = asyncio.get_running_loop()
             observation_count = 0
             last_status_log = 0
             
             while connection.is_active:
+                payload = None
+                
                 # Get room status
                 player_room_id = self.room_manager.player_to_room.get(connection.player_id, "")
                 room_info = self.room_manager.get_room_info(player_room_id)
@@ -332,23 +412,13 @@ class ArenaBattleServicer(arena_pb2_grpc.ArenaBattleServiceServicer):
                         obs_data = room_state.get_observation(connection.bot_id)
                         
                         if obs_data:
-                            observation = arena_pb2.Observation(
-                                tick=obs_data['tick'],
-                                self_pos=arena_pb2.Vec2(x=obs_data['self_pos']['x'], y=obs_data['self_pos']['y']),
-                                self_hp=obs_data['self_hp'],
-                                enemy_pos=arena_pb2.Vec2(x=obs_data['enemy_pos']['x'], y=obs_data['enemy_pos']['y']),
-                                enemy_hp=obs_data['enemy_hp'],
-                                has_line_of_sight=obs_data['has_line_of_sight'],
-                                arena_width=obs_data['arena_width'],
-                                arena_height=obs_data['arena_height']
-                            )
+                            observation = build_observation(obs_data)
                             
-                            # Add bullets and walls
-                            for bullet in obs_data['bullets']:
-                                observation.bullets.append(arena_pb2.Vec2(x=bullet['x'], y=bullet['y']))
-                            observation.walls.extend(obs_data['walls'])
-                            
-                            await context.write(observation)
+                            # Big payloads (many bullets) would stall every other client
+                            if len(obs_data['bullets']) > LARGE_OBSERVATION_BULLETS:
+                                payload = await loop.run_in_executor(None, _serialize_observation, observation)
+                            else:
+                                payload = observation
                             
                 else:
                     # ⏳ WAITING STATE - Send stable waiting observations
@@ -356,25 +426,30 @@ class ArenaBattleServicer(arena_pb2_grpc.ArenaBattleServiceServicer):
                     
                     # Log waiting status periodically (every 5 seconds)
                     if observation_count % 300 == 0:  # 300 frames = 5 seconds at 60fps
-                        logger.info(f"⏳ {connection.player_id} waiting in {player_room_id} ({player_count}/2 players)")
+                        logger.info("⏳ %s waiting in %s (%d/2 players)", connection.player_id, player_room_id, player_count)
                     
                     # Send stable waiting observation
-                    waiting_obs = arena_pb2.Observation(
+                    waiting_obs = _Observation(
                         tick=observation_count,
-                        self_pos=arena_pb2.Vec2(x=400.0, y=300.0),  # Center position
+                        self_pos=_Vec2(x=400.0, y=300.0),  # Center position
                         self_hp=100.0,  # Full health
-                        enemy_pos=arena_pb2.Vec2(x=0.0, y=0.0),    # No enemy
+                        enemy_pos=_Vec2(x=0.0, y=0.0),    # No enemy
                         enemy_hp=0.0,   # No enemy
                         has_line_of_sight=False,
                         arena_width=800.0,
                         arena_height=600.0
                     )
-                    await context.write(waiting_obs)
+                    payload = waiting_obs
                 
                 observation_count += 1
                 
-                # IMPORTANT: Stable frame rate
-                await asyncio.sleep(1/60)  # 60 FPS
+                # IMPORTANT: Stable frame rate - flush runs concurrently with the
+                # frame wait, so a slow write no longer stretches the 60 FPS period
+                frame_wait = asyncio.sleep(1/60)
+                if payload is not None:
+                    await asyncio.gather(context.write(payload), frame_wait)
+                else:
+                    await frame_wait
                 
         except Exception as e:
             logger.error(f"💥 Observation sending error: {e}")
@@ -395,7 +470,7 @@ class ArenaBattleServicer(arena_pb2_grpc.ArenaBattleServiceServicer):
             connection.is_active = False
             
             # Calculate connection duration
-            connection_duration = asyncio.get_event_loop().time() - connection.connection_time
+            connection_duration = time.monotonic() - connection.connection_time
             
             # Remove from connections
             if connection.bot_id in self.connections:
@@ -509,7 +584,7 @@ async def run_server(game_engine, port=50051, enable_logging=True):
     
     server = grpc.aio.server(futures.ThreadPoolExecutor(max_workers=10))
     servicer = ArenaBattleServicer(game_engine, enable_logging=enable_logging)
-    arena_pb2_grpc.add_ArenaBattleServiceServicer_to_server(servicer, server)
+    _add_servicer_to_server(servicer, server)
     
     listen_addr = f'[::]:{port}'
     server.add_insecure_port(listen_addr)
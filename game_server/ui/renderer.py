@@ -1,13 +1,25 @@
 # Modern UI Renderer - Fixed and Compact
 import pygame
+import numpy as np
 import math
 import asyncio
 import time
 import logging
-import random
-from typing import Optional
+from collections import OrderedDict
+from itertools import islice
 from ..engine.game_state import BotState, GameState
 logger = logging.getLogger(__name__)
+# Aim-line direction LUT (1024 bins over 2π); plain lists index faster than NumPy scalars
+_AIM_LUT_SIZE = 1024
+_AIM_LUT_SCALE = _AIM_LUT_SIZE / (2 * math.pi)
+_AIM_ANGLES = np.linspace(0, 2 * np.pi, _AIM_LUT_SIZE, endpoint=False)
+COS_LUT = np.cos(_AIM_ANGLES).tolist()
+SIN_LUT = np.sin(_AIM_ANGLES).tolist()
+def _circle_mask(size, radius, width=0):
+    """[y, x] bool mask of the pixels pygame.draw.circle covers, centered in a size x size square"""
+    surf = pygame.Surface((size, size))
+    pygame.draw.circle(surf, (255, 255, 255), (size // 2, size // 2), radius, width)
+    return pygame.surfarray.array_red(surf).T > 0
 class ModernColors:
     """Modern color palette with gradients and effects"""
     # Base colors
@@ -55,17 +67,26 @@ class ModernButton:
     """Modern styled button with hover effects"""
     def __init__(self, x, y, width, height, text, font, active=False):
         self.rect = pygame.Rect(x, y, width, height)
+        # Precalculated edges/center for hit tests without Rect calls
+        self._x0, self._y0, self._x1, self._y1 = x, y, x + width, y + height
+        self._cx, self._cy = x + width // 2, y + height // 2
         self.text = text
         self.font = font
         self.active = active
         self.hover = False
         self.click_time = 0
+        self._text_surface = None  # Rendered label + blit position, rebuilt when font changes
+        self._text_pos = None
+        self._text_font = None
+    def _contains(self, pos):
+        ex, ey = pos
+        return self._x0 <= ex < self._x1 and self._y0 <= ey < self._y1
     def handle_event(self, event):
         """Handle button events"""
         if event.type == pygame.MOUSEMOTION:
-            self.hover = self.rect.collidepoint(event.pos)
+            self.hover = self._contains(event.pos)
         elif event.type == pygame.MOUSEBUTTONDOWN:
-            if self.rect.collidepoint(event.pos):
+            if self._contains(event.pos):
                 self.click_time = time.time()
                 return True
         return False
@@ -84,12 +105,22 @@ class ModernButton:
         border_color = ModernColors.NEON_CYAN if (self.active or self.hover) else ModernColors.TEXT_SECONDARY
         pygame.draw.rect(surface, border_color, self.rect, width=2, border_radius=8)
         # Draw button text
-        text_color = ModernColors.TEXT_PRIMARY
-        text_surface = self.font.render(self.text, True, text_color)
-        text_rect = text_surface.get_rect(center=self.rect.center)
-        surface.blit(text_surface, text_rect)
+        if self._text_font is not self.font:
+            self._text_surface = self.font.render(self.text, True, ModernColors.TEXT_PRIMARY)
+            w, h = self._text_surface.get_size()
+            self._text_pos = (self._cx - w // 2, self._cy - h // 2)
+            self._text_font = self.font
+        surface.blit(self._text_surface, self._text_pos)
 class GameRenderer:
     """Compact game renderer with fixed debug key"""
+    TEXT_CACHE_SIZE = 512  # Max cached text surfaces (LRU)
+    HP_BAR_WIDTH, HP_BAR_HEIGHT = 50, 6
+    STATUS_ICONS = ("🟢", "🟡", "🔴")
+    STATS_REFRESH_INTERVAL = 0.25  # Stats block re-rendered at 4 Hz
+    STATS_Y, BOT_LIST_Y = 245, 425  # Panel section tops (headers live in the static panel)
+    FRAME_TIME = 1 / 60
+    HANDLED_EVENTS = [pygame.QUIT, pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN,
+                      pygame.MOUSEMOTION, pygame.VIDEOEXPOSE]
     def __init__(self, arena_width=800, arena_height=600):
         # Calculate window size based on arena + UI
         self.ui_panel_width = 320
@@ -103,16 +134,40 @@ class GameRenderer:
         self.arena_offset_y = 60
         # Pygame objects
         self.screen = None
-        self.clock = None
         self.fonts = {}
+        self._text_cache = OrderedDict()  # (font, text, color) -> (Surface, w, h)
+        self._bg_surface = None  # Cached gradient, built once the display exists
+        self._panel_static = None  # Cached static part of the left panel
+        self._bullet_sprites = {}  # radius -> (glow + core surface, half size)
+        self._bot_sprites = {}  # (state, radius) -> (glow + body + border surface, half size)
+        self._arena_surf = None  # Offscreen arena in game coordinates (only when game size != arena size)
+        self._arena_view = None  # Screen subsurface the arena is scaled into
+        self._canvas = None  # Target surface for arena draw calls
+        self.scale_x = 1.0  # Screen pixels per game unit, per axis
+        self.scale_y = 1.0
+        self._icon_atlas = None  # Status icons pre-rendered once, blitted by sub-rect
+        self._atlas_rects = {}  # (glyph, color) -> Rect in _icon_atlas
+        self._hp_fill = {}  # fill color -> prebuilt full-width HP bar surface
+        self._scratch = None  # Reusable 256x256 SRCALPHA surface for dynamic highlights
+        self._stats_surf = None  # Last rendered stats block, reused between refreshes
+        self._stats_next_update = 0.0
+        self._bot_list_surf = None  # Last rendered bot list rows
+        self._bot_list_key = None  # Row contents the cached surface was rendered for
+        self._full_redraw = True  # First frame (and window exposes) flip the whole screen
+        self._panel_dirty = True  # Static panel + buttons need a redraw (input / hover change)
+        self._frame_deadline = 0.0  # perf_counter() time the next frame is due
+        # Bots drawn last frame as SoA (x, y, radius) in arena coords + parallel bot list, for click picking
+        self._bot_xyr = np.empty((16, 3), dtype=np.float32)
+        self._pick_bots = []
+        self._pick_grid = None  # (cell_size, {(cx, cy): [index]}) over _bot_xyr, built on first click per frame
+        self._arena_version = None  # (room_id, engine room version) the arena was last drawn for
+        self._display_ready = False  # convert()/convert_alpha() need an active display mode
         # State
         self.running = False
         self.selected_bot = None
         self.show_debug = False  # Debug state tracking
         # UI elements
         self.speed_buttons = []
-        # Animation timers
-        self.title_glow_phase = 0
         logger.info(f"Compact renderer initialized: {self.screen_width}x{self.screen_height}")
         self._setup_ui_elements()
         self.current_viewing_room = None  # For spectator mode
@@ -135,6 +190,7 @@ class GameRenderer:
             self.speed_buttons.append(button)
     def _initialize_fonts(self):
         """Initialize font system"""
+        self._text_cache.clear()
         try:
             self.fonts = {
                 'title': pygame.font.Font(None, 28),
@@ -151,129 +207,279 @@ class GameRenderer:
             # Emergency fallback
             default_font = pygame.font.Font(None, 16)
             self.fonts = {key: default_font for key in ['title', 'subtitle', 'normal', 'small', 'tiny']}
+    def _render_entry(self, font, text, color):
+        """Return (surface, width, height) for text, LRU-cached by (font, text, color)"""
+        key = (font, text, color)
+        entry = self._text_cache.get(key)
+        if entry is not None:
+            self._text_cache.move_to_end(key)
+            return entry
+        surface = font.render(text, True, color)
+        if self._display_ready:
+            surface = surface.convert_alpha()
+        entry = (surface, surface.get_width(), surface.get_height())
+        self._text_cache[key] = entry
+        if len(self._text_cache) > self.TEXT_CACHE_SIZE:
+            self._text_cache.popitem(last=False)
+        return entry
+    def _text_entry(self, text, font_key, color):
+        """Return (surface, width, height) for text in self.fonts[font_key]"""
+        return self._render_entry(self.fonts[font_key], text, color)
+    def _text(self, text, font_key, color):
+        """Return rendered text surface, cached by (font_key, text, color)"""
+        return self._text_entry(text, font_key, color)[0]
     async def run(self, game_engine):
         """Main rendering loop"""
         if not self._initialize_pygame():
             return
         logger.info("Starting compact game renderer...")
         self.running = True
+        self._frame_deadline = time.perf_counter()
         try:
             while self.running:
-                # Handle events
-                for event in pygame.event.get():
-                    if event.type == pygame.QUIT:
-                        self.running = False
-                    elif event.type == pygame.KEYDOWN:
-                        self._handle_key_press(event.key, game_engine)
-                    elif event.type == pygame.MOUSEBUTTONDOWN:
-                        self._handle_mouse_click(event.pos, game_engine)
-                    elif event.type == pygame.MOUSEMOTION:
-                        self._handle_mouse_motion(event)
-                # Update animations
-                self.title_glow_phase += 0.08
+                # Redraw the arena only when the viewed room has stepped since the last frame, or on input
+                room_id = self._viewed_room_id(game_engine)
+                arena_version = (room_id, game_engine.room_versions.get(room_id, 0))
+                arena_dirty = arena_version != self._arena_version
+                self._arena_version = arena_version
+                # Handle events: one pump per iteration (the loop is paced to FRAME_TIME below)
+                if self._process_events(game_engine):
+                    arena_dirty = True
+                # Minimized/hidden: skip rendering, keep pumping events at a slow rate
+                if not pygame.display.get_active():
+                    self._full_redraw = True  # Repaint everything once restored
+                    await asyncio.sleep(0.05)
+                    self._frame_deadline = time.perf_counter()
+                    continue
                 # Render frame
-                self._render_frame(game_engine)
-                # Control frame rate
-                self.clock.tick(60)
-                await asyncio.sleep(0.001)
+                self._render_frame(game_engine, arena_dirty)
+                # Control frame rate with an async deadline (clock.tick would block the event loop)
+                self._frame_deadline += self.FRAME_TIME
+                now = time.perf_counter()
+                if self._frame_deadline < now:
+                    self._frame_deadline = now  # Behind schedule: don't try to catch up
+                await asyncio.sleep(self._frame_deadline - now)
         except Exception as e:
             logger.error(f"Renderer error: {e}")
         finally:
             self._cleanup()
+    def _viewed_room_id(self, game_engine):
+        """Room shown in the arena: the selected room, or the first room in default mode"""
+        if self.viewing_mode != "default":
+            return self.viewing_mode
+        return next(iter(game_engine.room_states), None)
+    def _process_events(self, game_engine) -> bool:
+        """Pump SDL once and handle queued events; return True if the arena needs a redraw"""
+        arena_dirty = False
+        last_motion = None
+        pygame.event.pump()
+        for event in pygame.event.get(eventtype=self.HANDLED_EVENTS, pump=False):
+            if event.type == pygame.QUIT:
+                self.running = False
+            elif event.type == pygame.KEYDOWN:
+                self._handle_key_press(event.key, game_engine)
+                arena_dirty = self._panel_dirty = True
+            elif event.type == pygame.MOUSEBUTTONDOWN:
+                self._handle_mouse_click(event.pos, game_engine)
+                arena_dirty = self._panel_dirty = True
+            elif event.type == pygame.MOUSEMOTION:
+                last_motion = event  # Only the final position matters for hover
+            elif event.type == pygame.VIDEOEXPOSE:
+                self._full_redraw = True
+        pygame.event.clear(pump=False)  # Drop everything else
+        if last_motion is not None:
+            self._handle_mouse_motion(last_motion)
+        return arena_dirty
     def _initialize_pygame(self) -> bool:
         """Initialize Pygame with compact window"""
         try:
             pygame.init()
             # Create compact window
-            self.screen = pygame.display.set_mode((self.screen_width, self.screen_height))
+            size = (self.screen_width, self.screen_height)
+            try:
+                # SDL2 renderer-backed window: GPU present on flip. No vsync: present would block
+                # the asyncio thread; run() paces frames itself
+                self.screen = pygame.display.set_mode(size, pygame.SCALED | pygame.DOUBLEBUF)
+            except pygame.error as e:
+                logger.warning(f"Accelerated display unavailable ({e}), falling back to software window")
+                self.screen = pygame.display.set_mode(size)
+            self._display_ready = True
+            # Only queue the event types the loop handles
+            pygame.event.set_blocked(None)
+            pygame.event.set_allowed(self.HANDLED_EVENTS)
             pygame.display.set_caption("Arena Battle - Compact View")
-            self.clock = pygame.time.Clock()
             # Initialize font system
             self._initialize_fonts()
+            # Build cached surfaces in display format (after set_mode)
+            self._build_background()
+            self._build_static_panel()
+            self._prewarm_sprites()
+            self._build_icon_atlas()
+            self._build_hp_bars()
+            self._scratch = pygame.Surface((256, 256), pygame.SRCALPHA).convert_alpha()
+            self._arena_view = self.screen.subsurface(
+                (self.arena_offset_x, self.arena_offset_y, self.arena_width, self.arena_height))
             logger.info(f"Pygame initialized - Window: {self.screen_width}x{self.screen_height}")
             return True
         except Exception as e:
             logger.error(f"Failed to initialize Pygame: {e}")
             return False
-    def _render_frame(self, game_engine):
-        """Render complete frame"""
-        # Clear with gradient background
-        self._render_background()
-        # Render UI panel
-        self._render_ui_panel(game_engine)
-        # Render arena (perfectly fitted)
-        self._render_arena(game_engine)
-        # Update display
-        pygame.display.flip()
+    def _render_frame(self, game_engine, arena_dirty=True):
+        """Render frame; only the parts that changed since last frame are redrawn and pushed"""
+        panel_w = self._panel_static.get_width()
+        if self._full_redraw:
+            arena_dirty = True
+            self._panel_dirty = True
+        # Render UI panel (whole panel on input/hover, otherwise only stats / bot list when they change)
+        dirty_rects = self._render_ui_panel(game_engine)
+        if arena_dirty:
+            # Clear with gradient background
+            self._render_background()
+            # Render arena (perfectly fitted)
+            self._render_arena(game_engine)
+            dirty_rects.append((panel_w, 0, self.screen_width - panel_w, self.screen_height))
+        if not dirty_rects:
+            return  # Nothing changed: skip the present
+        # Update display: one flip beats rect updates once they cover most of the screen
+        dirty_area = sum(w * h for _, _, w, h in dirty_rects)
+        if self._full_redraw or dirty_area * 2 > self.screen_width * self.screen_height:
+            pygame.display.flip()
+            self._full_redraw = False
+        else:
+            pygame.display.update(dirty_rects)
+    def _build_background(self):
+        """Draw the background gradient once into an offscreen surface"""
+        width, height = self.screen_width, self.screen_height
+        self._bg_surface = pygame.Surface((width, height)).convert()
+        # Simple vertical gradient, one row color per y
+        ratio = (np.arange(height, dtype=np.float32) / height)[:, None]
+        c0 = np.array(ModernColors.BACKGROUND_PRIMARY, dtype=np.float32)
+        c1 = np.array(ModernColors.BACKGROUND_SECONDARY, dtype=np.float32)
+        rows = ((1 - ratio) * c0 + ratio * c1).astype(np.uint8)
+        # surfarray is indexed [x, y]
+        pixels = np.broadcast_to(rows[None, :, :], (width, height, 3))
+        pygame.surfarray.blit_array(self._bg_surface, np.ascontiguousarray(pixels))
     def _render_background(self):
-        """Render background"""
-        # Simple gradient
-        for y in range(self.screen_height):
-            ratio = y / self.screen_height
-            r = int(ModernColors.BACKGROUND_PRIMARY[0] * (1-ratio) + ModernColors.BACKGROUND_SECONDARY[0] * ratio)
-            g = int(ModernColors.BACKGROUND_PRIMARY[1] * (1-ratio) + ModernColors.BACKGROUND_SECONDARY[1] * ratio)  
-            b = int(ModernColors.BACKGROUND_PRIMARY[2] * (1-ratio) + ModernColors.BACKGROUND_SECONDARY[2] * ratio)
-            pygame.draw.line(self.screen, (r, g, b), (0, y), (self.screen_width, y))
-    def _render_ui_panel(self, game_engine):
-        """Render compact left UI panel"""
+        """Render background (only right of the panel; the static panel covers the rest)"""
+        panel_w = self._panel_static.get_width()
+        self.screen.blit(self._bg_surface, (panel_w, 0),
+                         (panel_w, 0, self.screen_width - panel_w, self.screen_height))
+    def _build_static_panel(self):
+        """Pre-render the parts of the left panel that never change"""
+        # 2px wider than the panel to include the border line
+        panel = pygame.Surface((self.ui_panel_width + 2, self.screen_height)).convert()
+        panel.blit(self._bg_surface, (0, 0))
         # Panel background
         panel_rect = pygame.Rect(0, 0, self.ui_panel_width, self.screen_height)
-        pygame.draw.rect(self.screen, ModernColors.BACKGROUND_TERTIARY, panel_rect)
+        pygame.draw.rect(panel, ModernColors.BACKGROUND_TERTIARY, panel_rect)
         # Panel border
-        pygame.draw.line(self.screen, ModernColors.NEON_CYAN, 
+        pygame.draw.line(panel, ModernColors.NEON_CYAN, 
                         (self.ui_panel_width, 0), (self.ui_panel_width, self.screen_height), 2)
-        y_offset = 20
         # Title
-        self._render_title(y_offset)
-        y_offset += 60
+        title_surface, w, h = self._text_entry("ARENA BATTLE", 'title', ModernColors.TEXT_PRIMARY)
+        blit_list = [(title_surface, (self.ui_panel_width//2 - w//2, 40 - h//2))]
         # PvP mode
-        mode_text = "🔥 PvP Combat Mode"
-        mode_surface = self.fonts['normal'].render(mode_text, True, ModernColors.NEON_PINK)
-        self.screen.blit(mode_surface, (25, y_offset))
-        y_offset += 40
+        mode_surface = self._text("🔥 PvP Combat Mode", 'normal', ModernColors.NEON_PINK)
+        blit_list.append((mode_surface, (25, 80)))
         # Speed control
-        speed_title = self.fonts['subtitle'].render("⚡ Speed Control", True, ModernColors.NEON_CYAN)
-        self.screen.blit(speed_title, (25, y_offset-20))
-        y_offset += 25
-        # Draw speed buttons
-        for button in self.speed_buttons:
-            button.draw(self.screen)
-        y_offset += 100
-        # Game statistics
-        self._render_stats(game_engine, y_offset)
-        y_offset += 180
-        
-        # # Room info
-        # room_title = self.fonts['subtitle'].render("🏠 Room Info", True, ModernColors.NEON_CYAN)
-        # self.screen.blit(room_title, (25, y_offset + 5))
-        # y_offset += 25
-        
-        # # Display current room (placeholder)
-        # room_text = f"Current: room_001"
-        # room_surface = self.fonts['small'].render(room_text, True, ModernColors.TEXT_SECONDARY)
-        # self.screen.blit(room_surface, (25, y_offset))
-        # y_offset += 40
-        
-        # Bot list
-        self._render_bot_list(game_engine, y_offset)
-        y_offset += 150
+        speed_title = self._text("⚡ Speed Control", 'subtitle', ModernColors.NEON_CYAN)
+        blit_list.append((speed_title, (25, 100)))
+        # Section headers
+        stats_title = self._text("📊 Statistics", 'subtitle', ModernColors.NEON_CYAN)
+        blit_list.append((stats_title, (25, self.STATS_Y)))
+        bots_title = self._text("🤖 Active Bots", 'subtitle', ModernColors.NEON_CYAN)
+        blit_list.append((bots_title, (25, self.BOT_LIST_Y + 10)))
         # Controls (at bottom)
-        self._render_controls(self.screen_height - 120)
-    def _render_title(self, y):
-        """Render animated title"""
-        title_text = "ARENA BATTLE"
-        # Glow effect
-        glow_intensity = int(100 + 50 * math.sin(self.title_glow_phase))
-        glow_color = (*ModernColors.NEON_CYAN[:3], glow_intensity)
-        # Main title
-        title_surface = self.fonts['title'].render(title_text, True, ModernColors.TEXT_PRIMARY)
-        title_rect = title_surface.get_rect(center=(self.ui_panel_width//2, y + 20))
-        self.screen.blit(title_surface, title_rect)
+        y = self.screen_height - 120
+        controls_title = self._text("🎮 Controls", 'subtitle', ModernColors.NEON_CYAN)
+        blit_list.append((controls_title, (25, y)))
+        y += 20
+        controls = [
+            "1,2,3,4 - Speed",
+            "Click - Select Bot", 
+            "D - Debug Mode",
+            "R - Cycle Rooms",
+            "S - Save Models",
+            "ESC - Quit"
+        ]
+        for control in controls:
+            control_surface = self._text(control, 'tiny', ModernColors.TEXT_SECONDARY)
+            blit_list.append((control_surface, (25, y)))
+            y += 14
+        panel.blits(blit_list, doreturn=0)
+        self._panel_static = panel
+    def _build_icon_atlas(self):
+        """Render bot-list status icons (each color variant + selection marker) into one atlas"""
+        glyphs = [(icon + " ", color) for icon, color in zip(
+            self.STATUS_ICONS,
+            (ModernColors.BOT_ALIVE, ModernColors.BOT_INVULNERABLE, ModernColors.BOT_DEAD))]
+        # Selected row is drawn entirely in cyan
+        glyphs += [(icon + " ", ModernColors.NEON_CYAN) for icon in self.STATUS_ICONS]
+        glyphs.append(("► ", ModernColors.NEON_CYAN))
+        
+        rendered = [(key, self.fonts['small'].render(key[0], True, key[1])) for key in glyphs]
+        width = sum(surf.get_width() for _, surf in rendered)
+        height = max(surf.get_height() for _, surf in rendered)
+        atlas = pygame.Surface((width, height), pygame.SRCALPHA)
+        
+        self._atlas_rects = {}
+        x = 0
+        for key, surf in rendered:
+            atlas.blit(surf, (x, 0))
+            self._atlas_rects[key] = pygame.Rect(x, 0, surf.get_width(), surf.get_height())
+            x += surf.get_width()
+        self._icon_atlas = atlas.convert_alpha()
+    
+    def _build_hp_bars(self):
+        """Prebuild full-width HP fill bars; a partial bar is a sub-rect blit"""
+        self._hp_fill = {}
+        for color in (ModernColors.HP_HIGH, ModernColors.HP_MEDIUM, ModernColors.HP_LOW):
+            bar = pygame.Surface((self.HP_BAR_WIDTH, self.HP_BAR_HEIGHT)).convert()
+            bar.fill(color)
+            self._hp_fill[color] = bar
+    
+    def _render_ui_panel(self, game_engine):
+        """Render compact left UI panel; return the screen rects that changed"""
+        stats_due = self._stats_surf is None or time.time() >= self._stats_next_update
+        bots, bot_list_key = self._bot_list_rows(game_engine)
+        list_changed = bot_list_key != self._bot_list_key
+        if self._panel_dirty:
+            self._panel_dirty = False
+            # Static background, title, headers and controls
+            self.screen.blit(self._panel_static, (0, 0))
+            # Draw speed buttons
+            for button in self.speed_buttons:
+                button.draw(self.screen)
+            # Game statistics + bot list (cached surfaces unless due / changed)
+            self._render_stats(game_engine, self.STATS_Y)
+            self._render_bot_list(bots, bot_list_key, self.BOT_LIST_Y)
+            return [(0, 0, self._panel_static.get_width(), self.screen_height)]
+        # Stats and bot list surfaces are opaque (panel background included), so they can be pushed alone
+        dirty_rects = []
+        if stats_due:
+            self._render_stats(game_engine, self.STATS_Y)
+            dirty_rects.append((25, self.STATS_Y) + self._stats_surf.get_size())
+        if list_changed:
+            self._render_bot_list(bots, bot_list_key, self.BOT_LIST_Y)
+            dirty_rects.append((0, self.BOT_LIST_Y + 25) + self._bot_list_surf.get_size())
+        return dirty_rects
     def _render_stats(self, game_engine, y):
-        """Render compact statistics"""
-        stats_title = self.fonts['subtitle'].render("📊 Statistics", True, ModernColors.NEON_CYAN)
-        self.screen.blit(stats_title, (25, y))
-        y += 25
+        """Render compact statistics (throttled to STATS_REFRESH_INTERVAL)"""
+        now = time.time()
+        if self._stats_surf is not None and now < self._stats_next_update:
+            self.screen.blit(self._stats_surf, (25, y))
+            return
+        self._stats_next_update = now + self.STATS_REFRESH_INTERVAL
+        
+        # Render whole block offscreen, on top of the matching static panel region (includes header)
+        width, height = self.ui_panel_width - 25, 25 + 16 * 10
+        if self._stats_surf is None:
+            self._stats_surf = pygame.Surface((width, height)).convert()
+        surf = self._stats_surf
+        surf.blit(self._panel_static, (0, 0), (25, y, width, height))
+        
+        blit_list = []
+        line_y = 25
         stats = game_engine.game_state.get_game_stats()
         # Compact stat display
         stat_lines = [
@@ -290,72 +496,79 @@ class GameRenderer:
         ]
         for line in stat_lines:
             if line:  # Skip empty lines
-                line_surface = self.fonts['small'].render(line, True, ModernColors.TEXT_SECONDARY)
-                self.screen.blit(line_surface, (25, y))
-            y += 16
-    def _render_bot_list(self, game_engine, y):
-        """Render compact bot list"""
-        bots_title = self.fonts['subtitle'].render("🤖 Active Bots", True, ModernColors.NEON_CYAN)
-        self.screen.blit(bots_title, (25, y + 10))
-        y += 25
-
+                line_surface = self._text(line, 'small', ModernColors.TEXT_SECONDARY)
+                blit_list.append((line_surface, (0, line_y)))
+            line_y += 16
+        surf.blits(blit_list, doreturn=0)
+        self.screen.blit(surf, (25, y))
+    def _bot_list_rows(self, game_engine):
+        """Return (bots, key) for the bot list; key changes whenever a visible row would change"""
         # Get bots from current viewing room
         if self.viewing_mode != "default":
             room_state = game_engine.get_room_state(self.viewing_mode)
             if room_state:
-                bots = list(room_state.bots.values())[:5]
+                bots = list(islice(room_state.bots.values(), 5))
             else:
                 bots = []
         else:
             # Fallback: get bots from first available room
-            available_rooms = list(game_engine.room_states.keys())
-            if available_rooms:
-                first_room = game_engine.room_states[available_rooms[0]]
-                bots = list(first_room.bots.values())[:5]
+            first_room = next(iter(game_engine.room_states.values()), None)
+            if first_room is not None:
+                bots = list(islice(first_room.bots.values(), 5))
             else:
                 bots = []
 
+        selected_id = self.selected_bot.id if self.selected_bot else None
+        key = (tuple((bot.id, bot.name, bot.state, bot.kills, bot.deaths) for bot in bots), selected_id)
+        return bots, key
+    def _render_bot_list(self, bots, key, y):
+        """Render compact bot list (header is part of the static panel); re-rendered only when rows change"""
+        y += 25
+        if key == self._bot_list_key:
+            self.screen.blit(self._bot_list_surf, (0, y))
+            return
+        self._bot_list_key = key
+        selected_id = key[1]
+        
+        # Rows are drawn offscreen (full panel width, so x stays in screen coords) over the static panel
+        width, height = self.ui_panel_width, 18 * 5
+        if self._bot_list_surf is None:
+            self._bot_list_surf = pygame.Surface((width, height)).convert()
+        surf = self._bot_list_surf
+        surf.blit(self._panel_static, (0, 0), (0, y, width, height))
+        blit_list = []
+        row_y = 0
         for bot in bots:
             # Status color
             if bot.state == BotState.ALIVE:
                 color = ModernColors.BOT_ALIVE
-                icon = "🟢"
+                icon = "🟢 "
             elif bot.state == BotState.INVULNERABLE:
                 color = ModernColors.BOT_INVULNERABLE
-                icon = "🟡"
+                icon = "🟡 "
             else:
                 color = ModernColors.BOT_DEAD
-                icon = "🔴"
-            # Bot info
+                icon = "🔴 "
+            # Bot info: icons come from the atlas, only the name is text-rendered
             bot_name = bot.name if len(bot.name) <= 12 else bot.name[:9] + "..."
-            bot_text = f"{icon} {bot_name}"
-            if bot == self.selected_bot:
-                bot_text = f"► {bot_text}"
+            x = 25
+            if bot.id == selected_id:
                 color = ModernColors.NEON_CYAN
-            bot_surface = self.fonts['small'].render(bot_text, True, color)
-            self.screen.blit(bot_surface, (25, y))
+                marker_rect = self._atlas_rects[("► ", color)]
+                blit_list.append((self._icon_atlas, (x, row_y), marker_rect))
+                x += marker_rect.width
+            icon_rect = self._atlas_rects[(icon, color)]
+            blit_list.append((self._icon_atlas, (x, row_y), icon_rect))
+            x += icon_rect.width
+            bot_surface = self._text(bot_name, 'small', color)
             # K/D on same line
             kd_text = f"{bot.kills}K/{bot.deaths}D"
-            kd_surface = self.fonts['tiny'].render(kd_text, True, ModernColors.TEXT_SECONDARY)
-            self.screen.blit(kd_surface, (200, y))
-            y += 18
-    def _render_controls(self, y):
-        """Render controls section"""
-        controls_title = self.fonts['subtitle'].render("🎮 Controls", True, ModernColors.NEON_CYAN)
-        self.screen.blit(controls_title, (25, y))
-        y += 20
-        controls = [
-            "1,2,3,4 - Speed",
-            "Click - Select Bot", 
-            "D - Debug Mode",
-            "R - Cycle Rooms",
-            "S - Save Models",
-            "ESC - Quit"
-        ]
-        for control in controls:
-            control_surface = self.fonts['tiny'].render(control, True, ModernColors.TEXT_SECONDARY)
-            self.screen.blit(control_surface, (25, y))
-            y += 14
+            kd_surface = self._text(kd_text, 'tiny', ModernColors.TEXT_SECONDARY)
+            blit_list.append((bot_surface, (x, row_y)))
+            blit_list.append((kd_surface, (200, row_y)))
+            row_y += 18
+        surf.blits(blit_list, doreturn=0)
+        self.screen.blit(surf, (0, y))
     def _render_arena(self, game_engine):
         """Render arena với room selection đúng - FIXED"""
         
@@ -377,16 +590,14 @@ class GameRenderer:
                 room_info = f"Default State (room '{self.viewing_mode}' not found)"
         else:
             # Fallback to first available room instead of default
-            available_rooms = list(game_engine.room_states.keys())
-            if available_rooms:
-                fallback_room = available_rooms[0]
+            fallback_room = next(iter(game_engine.room_states), None)
+            if fallback_room is not None:
                 game_state = game_engine.room_states[fallback_room]
                 wall_count = len(game_state.walls)
                 obstacle_count = wall_count - 4
                 room_info = f"Viewing: {fallback_room} ({wall_count} walls, {obstacle_count} obstacles)"
             else:
                 # Create empty state for display
-                from game_server.engine.game_state import GameState
                 game_state = GameState()
                 room_info = "No rooms available"
         
@@ -400,15 +611,31 @@ class GameRenderer:
         
         # Header với room info
         header_text = f"🏟️ Combat Arena ({self.arena_width}x{self.arena_height})"
-        header_surface = self.fonts['normal'].render(header_text, True, ModernColors.TEXT_PRIMARY)
+        header_surface = self._text(header_text, 'normal', ModernColors.TEXT_PRIMARY)
         self.screen.blit(header_surface, (self.arena_offset_x, self.arena_offset_y - 30))
         
         # Room info detail
-        room_surface = self.fonts['small'].render(room_info, True, ModernColors.TEXT_SECONDARY)
+        room_surface = self._text(room_info, 'small', ModernColors.TEXT_SECONDARY)
         self.screen.blit(room_surface, (self.arena_offset_x, self.arena_offset_y - 10))
         
+        # Same size: draw straight onto the screen. Otherwise draw offscreen in game
+        # coordinates and scale once (each axis separately, like smoothscale does)
+        game_size = (int(game_state.width), int(game_state.height))
+        scaled = game_size != arena_rect.size
+        if scaled:
+            if self._arena_surf is None or self._arena_surf.get_size() != game_size:
+                self._arena_surf = pygame.Surface(game_size).convert()
+            canvas = self._arena_surf
+            local_rect = canvas.get_rect()
+        else:
+            canvas = self.screen
+            local_rect = arena_rect
+        self._canvas = canvas
+        self.scale_x = arena_rect.width / game_size[0]
+        self.scale_y = arena_rect.height / game_size[1]
+        
         # Arena background
-        pygame.draw.rect(self.screen, ModernColors.ARENA_BG, arena_rect)
+        canvas.fill(ModernColors.ARENA_BG, local_rect)
         
         # Border color theo room
         if self.viewing_mode == "room_001":
@@ -418,14 +645,17 @@ class GameRenderer:
         else:
             border_color = ModernColors.NEON_YELLOW
             
-        pygame.draw.rect(self.screen, border_color, arena_rect, width=2)
+        pygame.draw.rect(canvas, border_color, local_rect, width=2)
         
         # Render walls (QUAN TRỌNG)
-        self._render_walls(game_state, arena_rect)
+        self._render_walls(game_state, local_rect)
         
         # Render các element khác
-        self._render_bullets(game_state, arena_rect)
-        self._render_bots(game_state, arena_rect)
+        self._render_bullets(game_state, local_rect)
+        self._render_bots(game_state, local_rect)
+        
+        if scaled:
+            pygame.transform.smoothscale(canvas, arena_rect.size, self._arena_view)
         
         # Debug info
         if self.show_debug:
@@ -433,119 +663,184 @@ class GameRenderer:
     
     def _render_walls(self, game_state, arena_rect):
         """Render walls với debug info"""
+        ax0, ay0, ax1, ay1 = arena_rect.left, arena_rect.top, arena_rect.right, arena_rect.bottom
         for i, wall in enumerate(game_state.walls):
-            wall_rect = pygame.Rect(
-                arena_rect.x + wall.x,
-                arena_rect.y + wall.y,
-                wall.width,
-                wall.height
-            )
+            wx = ax0 + wall.x
+            wy = ay0 + wall.y
+            # Cull walls hoàn toàn nằm ngoài arena
+            if wx > ax1 or wy > ay1 or wx + wall.width < ax0 or wy + wall.height < ay0:
+                continue
+            wall_rect = pygame.Rect(wx, wy, wall.width, wall.height)
             
             # Render wall
-            pygame.draw.rect(self.screen, ModernColors.WALL_PRIMARY, wall_rect)
-            pygame.draw.rect(self.screen, ModernColors.WALL_BORDER, wall_rect, width=2)
+            pygame.draw.rect(self._canvas, ModernColors.WALL_PRIMARY, wall_rect)
+            pygame.draw.rect(self._canvas, ModernColors.WALL_BORDER, wall_rect, width=2)
             
             # Debug outline
             if self.show_debug:
-                pygame.draw.rect(self.screen, ModernColors.NEON_YELLOW, wall_rect, width=1)
+                pygame.draw.rect(self._canvas, ModernColors.NEON_YELLOW, wall_rect, width=1)
     
     def _render_bullets(self, game_state, arena_rect):
-        """Render bullets with glow"""
+        """Render bullets: one prebuilt glow+core stamp per bullet, submitted in a single blits() call"""
+        ax0, ay0, ax1, ay1 = arena_rect.left, arena_rect.top, arena_rect.right, arena_rect.bottom
+        sprites = self._bullet_sprites
+        blit_list = []
         for bullet in game_state.bullets:
-            bullet_x = arena_rect.x + bullet.x
-            bullet_y = arena_rect.y + bullet.y
-            bullet_radius = max(3, bullet.radius)
-            
-            # Glow effect
-            for i in range(3, 0, -1):
-                glow_radius = bullet_radius * (1 + i * 0.5)
-                glow_alpha = 80 // i
-                glow_color = (*ModernColors.BULLET_GLOW[:3], glow_alpha)
-                
-                glow_surf = pygame.Surface((glow_radius * 4, glow_radius * 4), pygame.SRCALPHA)
-                pygame.draw.circle(glow_surf, glow_color, (glow_radius * 2, glow_radius * 2), glow_radius)
-                self.screen.blit(glow_surf, (bullet_x - glow_radius * 2, bullet_y - glow_radius * 2), 
-                               special_flags=pygame.BLEND_ALPHA_SDL2)
+            bullet_x = ax0 + bullet.x
+            bullet_y = ay0 + bullet.y
+            bullet_radius = max(3, int(round(bullet.radius)))  # int radius = stable sprite cache key
             
-            # Core bullet
-            pygame.draw.circle(self.screen, ModernColors.BULLET_CORE,
-                             (int(bullet_x), int(bullet_y)), int(bullet_radius))
+            # Cull theo bán kính glow lớn nhất (2.5r)
+            margin = bullet_radius * 2.5
+            if not (ax0 - margin <= bullet_x <= ax1 + margin and ay0 - margin <= bullet_y <= ay1 + margin):
+                continue
             
-            # Debug info
-            if self.show_debug:
+            entry = sprites.get(bullet_radius) or self._bullet_sprite(bullet_radius)
+            half = entry[1]
+            blit_list.append((entry[0], (int(bullet_x) - half, int(bullet_y) - half)))
+        self._canvas.blits(blit_list, doreturn=0)
+        
+        # Debug info
+        if self.show_debug:
+            vel_scale = 0.1
+            for bullet in game_state.bullets:
                 # Velocity vector
-                vel_scale = 0.1
+                bullet_x = ax0 + bullet.x
+                bullet_y = ay0 + bullet.y
                 end_x = bullet_x + bullet.vel_x * vel_scale
                 end_y = bullet_y + bullet.vel_y * vel_scale
-                pygame.draw.line(self.screen, ModernColors.NEON_YELLOW,
+                pygame.draw.line(self._canvas, ModernColors.NEON_YELLOW,
                                (int(bullet_x), int(bullet_y)),
                                (int(end_x), int(end_y)), 2)
     
+    def _layered_sprite(self, half, layers):
+        """Composite circles/rings into one (2*half)^2 RGBA sprite centered at (half, half)
+        
+        layers: (radius, width, color, alpha) from bottom to top, width as in pygame.draw.circle
+        (0 = filled). Layer shapes come from pygame.draw.circle itself and are composited with
+        straight-alpha "over", so the sprite matches drawing the layers one by one onto the screen.
+        """
+        size = half * 2
+        rgb = np.zeros((size, size, 3), dtype=np.float32)
+        alpha = np.zeros((size, size), dtype=np.float32)
+        
+        for radius, width, color, a in layers:
+            mask = _circle_mask(size, radius, width)
+            a = a / 255.0
+            new_alpha = a + alpha[mask] * (1.0 - a)
+            rgb[mask] = (np.asarray(color[:3], dtype=np.float32) * a
+                         + rgb[mask] * (alpha[mask] * (1.0 - a))[:, None]) / new_alpha[:, None]
+            alpha[mask] = new_alpha
+        
+        img = np.empty((size, size, 4), dtype=np.uint8)
+        img[..., :3] = np.round(rgb).astype(np.uint8)
+        img[..., 3] = np.round(alpha * 255.0).astype(np.uint8)
+        sprite = pygame.image.frombuffer(img.tobytes(), (size, size), "RGBA")
+        return sprite.convert_alpha() if self._display_ready else sprite.copy()
+    
+    def _bullet_sprite(self, radius):
+        """Return cached (sprite, half_size): 3 glow layers + core circle"""
+        entry = self._bullet_sprites.get(radius)
+        if entry is not None:
+            return entry
+        half = int(math.ceil(radius * 2.5)) + 1
+        layers = [(radius * (1 + i * 0.5), 0, ModernColors.BULLET_GLOW, 80 // i) for i in range(3, 0, -1)]
+        layers.append((radius, 0, ModernColors.BULLET_CORE, 255))
+        entry = (self._layered_sprite(half, layers), half)
+        self._bullet_sprites[radius] = entry
+        return entry
+    
+    def _prewarm_sprites(self):
+        """Build bullet/bot sprites for default radius so the first frames don't stall"""
+        self._bullet_sprites.clear()
+        self._bot_sprites.clear()
+        self._bullet_sprite(3)
+        for state in BotState:
+            self._bot_sprite(state, 15)
+    
+    def _bot_sprite(self, state, radius):
+        """Return cached (sprite, half_size): glow layers + body + 2px white border"""
+        key = (state, radius)
+        entry = self._bot_sprites.get(key)
+        if entry is not None:
+            return entry
+        
+        if state == BotState.ALIVE:
+            core_color, glow_color = ModernColors.BOT_ALIVE, ModernColors.BOT_ALIVE_GLOW
+        elif state == BotState.INVULNERABLE:
+            core_color, glow_color = ModernColors.BOT_INVULNERABLE, ModernColors.BOT_INVULNERABLE_GLOW
+        else:
+            core_color, glow_color = ModernColors.BOT_DEAD, None  # Dead bots have no glow
+        
+        layers = []
+        if glow_color:
+            layers += [(radius * (1 + i * 0.3), 0, glow_color, 60 // i) for i in range(3, 0, -1)]
+        layers.append((radius, 0, core_color, 255))
+        layers.append((radius, 2, ModernColors.WHITE, 255))
+        
+        half = int(math.ceil(radius * 1.9 if glow_color else radius)) + 1
+        entry = (self._layered_sprite(half, layers), half)
+        self._bot_sprites[key] = entry
+        return entry
+    
     def _render_bots(self, game_state, arena_rect):
         """Render bots"""
+        ax0, ay0, ax1, ay1 = arena_rect.left, arena_rect.top, arena_rect.right, arena_rect.bottom
+        if len(self._bot_xyr) < len(game_state.bots):
+            self._bot_xyr = np.empty((len(game_state.bots) * 2, 3), dtype=np.float32)
+        xyr = self._bot_xyr
+        pick_bots = self._pick_bots
+        pick_bots.clear()
+        self._pick_grid = None
         for bot in game_state.bots.values():
+            # Margin đủ cho glow, aim line, HP bar và tên
+            margin = max(12, bot.radius) + 40
+            bot_x = ax0 + bot.x
+            bot_y = ay0 + bot.y
+            if not (ax0 - margin <= bot_x <= ax1 + margin and ay0 - margin <= bot_y <= ay1 + margin):
+                continue
+            xyr[len(pick_bots)] = (bot.x, bot.y, bot.radius)
+            pick_bots.append(bot)
             self._render_bot(bot, arena_rect)
     
     def _render_bot(self, bot, arena_rect):
         """Render individual bot"""
         bot_x = arena_rect.x + bot.x
         bot_y = arena_rect.y + bot.y
-        bot_radius = max(12, bot.radius)
-        
-        # Bot colors
-        if bot.state == BotState.ALIVE:
-            core_color = ModernColors.BOT_ALIVE
-            glow_color = ModernColors.BOT_ALIVE_GLOW
-        elif bot.state == BotState.INVULNERABLE:
-            core_color = ModernColors.BOT_INVULNERABLE
-            glow_color = ModernColors.BOT_INVULNERABLE_GLOW
-        else:
-            core_color = ModernColors.BOT_DEAD
-            glow_color = (*ModernColors.BOT_DEAD[:3], 50)
+        bot_radius = max(12, int(round(bot.radius)))  # int radius = stable glow cache key
         
         # Selection highlight
         if bot == self.selected_bot:
+            scratch = self._scratch
             for i in range(4, 0, -1):
-                highlight_radius = bot_radius + i * 4
+                highlight_radius = min(int(bot_radius + i * 4), 127)  # scratch center is (128, 128)
                 highlight_alpha = 60 // i
                 highlight_color = (*ModernColors.NEON_CYAN[:3], highlight_alpha)
                 
-                highlight_surf = pygame.Surface((highlight_radius * 4, highlight_radius * 4), pygame.SRCALPHA)
-                pygame.draw.circle(highlight_surf, highlight_color,
-                                 (highlight_radius * 2, highlight_radius * 2), highlight_radius)
-                self.screen.blit(highlight_surf,
-                               (bot_x - highlight_radius * 2, bot_y - highlight_radius * 2),
-                               special_flags=pygame.BLEND_ALPHA_SDL2)
-        
-        # Bot glow
-        if bot.state != BotState.DEAD:
-            for i in range(3, 0, -1):
-                glow_radius = bot_radius * (1 + i * 0.3)
-                glow_alpha = 60 // i
-                current_glow = (*glow_color[:3], glow_alpha)
-                
-                glow_surf = pygame.Surface((glow_radius * 4, glow_radius * 4), pygame.SRCALPHA)
-                pygame.draw.circle(glow_surf, current_glow,
-                                 (glow_radius * 2, glow_radius * 2), glow_radius)
-                self.screen.blit(glow_surf,
-                               (bot_x - glow_radius * 2, bot_y - glow_radius * 2),
+                scratch.fill((0, 0, 0, 0))
+                pygame.draw.circle(scratch, highlight_color, (128, 128), highlight_radius)
+                size = highlight_radius * 2 + 1
+                self._canvas.blit(scratch,
+                               (int(bot_x) - highlight_radius, int(bot_y) - highlight_radius),
+                               (128 - highlight_radius, 128 - highlight_radius, size, size),
                                special_flags=pygame.BLEND_ALPHA_SDL2)
         
-        # Main bot body
-        pygame.draw.circle(self.screen, core_color, (int(bot_x), int(bot_y)), int(bot_radius))
-        pygame.draw.circle(self.screen, ModernColors.WHITE, (int(bot_x), int(bot_y)), int(bot_radius), 2)
+        # Bot glow + body + border (prebuilt sprite)
+        bot_surf, half = self._bot_sprite(bot.state, bot_radius)
+        self._canvas.blit(bot_surf, (int(bot_x) - half, int(bot_y) - half))
         
         # Aim line
         if bot.state in [BotState.ALIVE, BotState.INVULNERABLE]:
             aim_length = bot_radius + 25
-            aim_end_x = bot_x + math.cos(bot.aim_angle) * aim_length
-            aim_end_y = bot_y + math.sin(bot.aim_angle) * aim_length
+            i = int(bot.aim_angle * _AIM_LUT_SCALE) & (_AIM_LUT_SIZE - 1)
+            aim_end_x = bot_x + COS_LUT[i] * aim_length
+            aim_end_y = bot_y + SIN_LUT[i] * aim_length
             
-            pygame.draw.line(self.screen, ModernColors.NEON_YELLOW,
+            pygame.draw.line(self._canvas, ModernColors.NEON_YELLOW,
                            (int(bot_x), int(bot_y)),
                            (int(aim_end_x), int(aim_end_y)), 3)
             
-            pygame.draw.circle(self.screen, ModernColors.NEON_YELLOW,
+            pygame.draw.circle(self._canvas, ModernColors.NEON_YELLOW,
                              (int(aim_end_x), int(aim_end_y)), 5)
         
         # HP bar
@@ -554,28 +849,31 @@ class GameRenderer:
         
         # Bot name
         name_display = bot.name if len(bot.name) <= 10 else bot.name[:7] + "..."
-        name_surface = self.fonts['tiny'].render(name_display, True, ModernColors.TEXT_PRIMARY)
-        name_rect = name_surface.get_rect(center=(int(bot_x), int(bot_y + bot_radius + 20)))
+        name_surface, w, h = self._text_entry(name_display, 'tiny', ModernColors.TEXT_PRIMARY)
+        name_x = int(bot_x) - w // 2
+        name_y = int(bot_y + bot_radius + 20) - h // 2
         
         # Name background
-        bg_rect = name_rect.inflate(6, 2)
-        pygame.draw.rect(self.screen, (*ModernColors.BLACK[:3], 180), bg_rect)
-        self.screen.blit(name_surface, name_rect)
+        pygame.draw.rect(self._canvas, (*ModernColors.BLACK[:3], 180), (name_x - 3, name_y - 1, w + 6, h + 2))
+        self._canvas.blit(name_surface, (name_x, name_y))
         
         # Debug info
         if self.show_debug:
             debug_text = f"ID:{bot.id} HP:{bot.hp:.0f} K/D:{bot.kills}/{bot.deaths}"
-            debug_surface = self.fonts['tiny'].render(debug_text, True, ModernColors.NEON_CYAN)
-            self.screen.blit(debug_surface, (int(bot_x - 40), int(bot_y + bot_radius + 35)))
+            debug_surface = self._text(debug_text, 'tiny', ModernColors.NEON_CYAN)
+            self._canvas.blit(debug_surface, (int(bot_x - 40), int(bot_y + bot_radius + 35)))
     
     def _render_hp_bar(self, bot, x, y):
         """Render HP bar"""
-        bar_width = 50
-        bar_height = 6
+        bar_width = self.HP_BAR_WIDTH
+        bar_height = self.HP_BAR_HEIGHT
+        x = int(x)
+        y = int(y)
+        x0 = x - bar_width // 2
         
         # Background
-        bg_rect = pygame.Rect(x - bar_width//2, y, bar_width, bar_height)
-        pygame.draw.rect(self.screen, (*ModernColors.HP_BG[:3], 200), bg_rect)
+        bg_rect = (x0, y, bar_width, bar_height)
+        pygame.draw.rect(self._canvas, (*ModernColors.HP_BG[:3], 200), bg_rect)
         
         # HP fill
         hp_ratio = bot.hp / bot.max_hp
@@ -589,17 +887,15 @@ class GameRenderer:
             else:
                 fill_color = ModernColors.HP_LOW
             
-            fill_rect = pygame.Rect(x - bar_width//2, y, fill_width, bar_height)
-            pygame.draw.rect(self.screen, fill_color, fill_rect)
+            self._canvas.blit(self._hp_fill[fill_color], (x0, y), (0, 0, fill_width, bar_height))
         
         # Border
-        pygame.draw.rect(self.screen, ModernColors.WHITE, bg_rect, width=1)
+        pygame.draw.rect(self._canvas, ModernColors.WHITE, bg_rect, width=1)
         
         # HP text
         hp_text = f"{bot.hp:.0f}"
-        hp_surface = self.fonts['tiny'].render(hp_text, True, ModernColors.TEXT_PRIMARY)
-        hp_rect = hp_surface.get_rect(center=(int(x), int(y - 8)))
-        self.screen.blit(hp_surface, hp_rect)
+        hp_surface, w, h = self._text_entry(hp_text, 'tiny', ModernColors.TEXT_PRIMARY)
+        self._canvas.blit(hp_surface, (x - w // 2, y - 8 - h // 2))
     
     def _render_debug_overlay(self, game_state, arena_rect):
         """Render debug information overlay"""
@@ -608,56 +904,16 @@ class GameRenderer:
         debug_info = [
             f"Debug Mode: ON",
             f"Arena: {arena_rect.width}x{arena_rect.height}",
-            f"Scale: {self.scale:.2f}",
+            f"Scale: {self.scale_x:.2f}x{self.scale_y:.2f}",
             f"Bots: {len(game_state.bots)}",
             f"Bullets: {len(game_state.bullets)}",
             f"Walls: {len(game_state.walls)}"
         ]
         
         for i, info in enumerate(debug_info):
-            debug_surface = self.fonts['tiny'].render(info, True, ModernColors.NEON_YELLOW)
+            debug_surface = self._text(info, 'tiny', ModernColors.NEON_YELLOW)
             self.screen.blit(debug_surface, (arena_rect.x, debug_y + i * 12))
     
-    def _render_selected_bot_info(self):
-        """Render selected bot info panel"""
-        if not self.selected_bot:
-            return
-        
-        # Compact info panel
-        panel_width = 200
-        panel_height = 160
-        panel_x = self.screen_width - panel_width - 10
-        panel_y = 80
-        
-        panel_rect = pygame.Rect(panel_x, panel_y, panel_width, panel_height)
-        
-        # Panel background
-        pygame.draw.rect(self.screen, (*ModernColors.BACKGROUND_TERTIARY[:3], 240), panel_rect)
-        pygame.draw.rect(self.screen, ModernColors.NEON_CYAN, panel_rect, width=2)
-        
-        # Title
-        title_surface = self.fonts['normal'].render("🎯 Selected Bot", True, ModernColors.NEON_CYAN)
-        self.screen.blit(title_surface, (panel_x + 10, panel_y + 10))
-        
-        # Bot details
-        details = [
-            f"Name: {self.selected_bot.name[:15]}",
-            f"ID: {self.selected_bot.id}",
-            f"Player: {self.selected_bot.player_id[:12]}",
-            f"State: {self.selected_bot.state.value.upper()}",
-            f"HP: {self.selected_bot.hp:.1f}/{self.selected_bot.max_hp}",
-            f"Position: ({self.selected_bot.x:.0f}, {self.selected_bot.y:.0f})",
-            f"Kills: {self.selected_bot.kills}",
-            f"Deaths: {self.selected_bot.deaths}",
-            f"K/D: {self.selected_bot.kills/max(self.selected_bot.deaths,1):.2f}"
-        ]
-        
-        detail_y = panel_y + 35
-        for detail in details:
-            detail_surface = self.fonts['small'].render(detail, True, ModernColors.TEXT_SECONDARY)
-            self.screen.blit(detail_surface, (panel_x + 10, detail_y))
-            detail_y += 14
-    
     def _handle_key_press(self, key, game_engine):
         """Handle keyboard input - FIXED DEBUG KEY"""
         if key == pygame.K_ESCAPE:
@@ -707,24 +963,25 @@ class GameRenderer:
         
         # Check arena clicks for bot selection
         if mouse_x >= self.arena_offset_x and mouse_y >= self.arena_offset_y:
-            # Convert screen coordinates to arena coordinates
-            arena_x = mouse_x - self.arena_offset_x
-            arena_y = mouse_y - self.arena_offset_y
-            
             # Check if click is within arena bounds
-            if 0 <= arena_x <= self.arena_width and 0 <= arena_y <= self.arena_height:
-                # Find closest bot
+            if (mouse_x - self.arena_offset_x <= self.arena_width
+                    and mouse_y - self.arena_offset_y <= self.arena_height):
+                # Convert screen coordinates to game coordinates
+                arena_x = (mouse_x - self.arena_offset_x) / self.scale_x
+                arena_y = (mouse_y - self.arena_offset_y) / self.scale_y
+                # Find closest bot among those drawn last frame (squared distances, no sqrt)
                 closest_bot = None
-                closest_distance = float('inf')
-                
-                for bot in game_engine.game_state.bots.values():
-                    dx = bot.x - arena_x
-                    dy = bot.y - arena_y
-                    distance = math.sqrt(dx*dx + dy*dy)
-                    
-                    if distance < bot.radius + 25 and distance < closest_distance:
-                        closest_bot = bot
-                        closest_distance = distance
+                candidates = self._pick_candidates(arena_x, arena_y)
+                if candidates:
+                    xyr = self._bot_xyr[candidates]
+                    dx = xyr[:, 0] - arena_x
+                    dy = xyr[:, 1] - arena_y
+                    d2 = dx * dx + dy * dy
+                    reach = xyr[:, 2] + 25
+                    d2[d2 >= reach * reach] = np.inf
+                    idx = int(d2.argmin())
+                    if d2[idx] != np.inf:
+                        closest_bot = self._pick_bots[candidates[idx]]
                 
                 if closest_bot:
                     self.selected_bot = closest_bot
@@ -732,10 +989,37 @@ class GameRenderer:
                 else:
                     self.selected_bot = None
     
+    def _pick_candidates(self, arena_x, arena_y):
+        """Indices into _pick_bots from the 3x3 grid cells around (arena_x, arena_y)"""
+        count = len(self._pick_bots)
+        if not count:
+            return []
+        if self._pick_grid is None:
+            xyr = self._bot_xyr[:count]
+            # Cell ≥ pick reach, so any bot within reach lies in the 3x3 neighbourhood
+            cell_size = max(64.0, float(xyr[:, 2].max()) + 25)
+            grid = {}
+            cells = np.floor(xyr[:, :2] / cell_size).astype(np.int64).tolist()
+            for i, cell in enumerate(cells):
+                grid.setdefault(tuple(cell), []).append(i)
+            self._pick_grid = (cell_size, grid)
+        
+        cell_size, grid = self._pick_grid
+        cx = math.floor(arena_x / cell_size)
+        cy = math.floor(arena_y / cell_size)
+        candidates = []
+        for gx in (cx - 1, cx, cx + 1):
+            for gy in (cy - 1, cy, cy + 1):
+                candidates.extend(grid.get((gx, gy), ()))
+        return candidates
+    
     def _handle_mouse_motion(self, event):
-        """Handle mouse motion for hover effects"""
+        """Handle mouse motion for hover effects; the panel is redrawn only if a hover state flipped"""
         for button in self.speed_buttons:
+            was_hover = button.hover
             button.handle_event(event)
+            if button.hover != was_hover:
+                self._panel_dirty = True
     
     def stop(self):
         """Stop the renderer"""
@@ -1,11 +1,8 @@
 # proto/__init__.py
 # Protocol buffer package
 
-# Import generated files
-from .arena_pb2 import *
-from .arena_pb2_grpc import *
-
-# Make available at package level
+# Make generated modules available at package level
+# (callers use `from proto import arena_pb2, arena_pb2_grpc`; no wildcard re-export of message classes)
 from . import arena_pb2
 from . import arena_pb2_grpc
 
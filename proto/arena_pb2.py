@@ -24,7 +24,7 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x0b\x61rena.proto\x12\x05\x61rena\"\x1c\n\x04Vec2\x12\t\n\x01x\x18\x01 \x01(\x02\x12\t\n\x01y\x18\x02 \x01(\x02\";\n\x04Rect\x12\t\n\x01x\x18\x01 \x01(\x02\x12\t\n\x01y\x18\x02 \x01(\x02\x12\r\n\x05width\x18\x03 \x01(\x02\x12\x0e\n\x06height\x18\x04 \x01(\x02\"\xf0\x01\n\x0bObservation\x12\x0c\n\x04tick\x18\x01 \x01(\r\x12\x1d\n\x08self_pos\x18\x02 \x01(\x0b\x32\x0b.arena.Vec2\x12\x0f\n\x07self_hp\x18\x03 \x01(\x02\x12\x1e\n\tenemy_pos\x18\x04 \x01(\x0b\x32\x0b.arena.Vec2\x12\x10\n\x08\x65nemy_hp\x18\x05 \x01(\x02\x12\x1c\n\x07\x62ullets\x18\x06 \x03(\x0b\x32\x0b.arena.Vec2\x12\r\n\x05walls\x18\x07 \x03(\x02\x12\x19\n\x11has_line_of_sight\x18\x08 \x01(\x08\x12\x13\n\x0b\x61rena_width\x18\t \x01(\x02\x12\x14\n\x0c\x61rena_height\x18\n \x01(\x02\"F\n\x06\x41\x63tion\x12\x1b\n\x06thrust\x18\x01 \x01(\x0b\x32\x0b.arena.Vec2\x12\x11\n\taim_angle\x18\x02 \x01(\x02\x12\x0c\n\x04\x66ire\x18\x03 \x01(\x08\"6\n\x0f\x42otRegistration\x12\x11\n\tplayer_id\x18\x01 \x01(\t\x12\x10\n\x08\x62ot_name\x18\x02 \x01(\t\"H\n\x14RegistrationResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x0e\n\x06\x62ot_id\x18\x03 \x01(\x05\"_\n\tGameEvent\x12\x0c\n\x04type\x18\x01 \x01(\t\x12\x0e\n\x06\x62ot_id\x18\x02 \x01(\x05\x12\x0e\n\x06reward\x18\x03 \x01(\x02\x12\x0c\n\x04\x64one\x18\x04 \x01(\x08\x12\x16\n\x0erelated_bot_id\x18\x05 \x01(\x05\"\x85\x01\n\tGameStats\x12\x13\n\x0btotal_kills\x18\x01 \x01(\x05\x12\x14\n\x0ctotal_deaths\x18\x02 \x01(\x05\x12\x18\n\x10kill_death_ratio\x18\x03 \x01(\x02\x12\x14\n\x0cgames_played\x18\x04 \x01(\x05\x12\x1d\n\x15\x61verage_survival_time\x18\x05 \x01(\x02\x32\xf2\x01\n\x12\x41renaBattleService\x12\x42\n\x0bRegisterBot\x12\x16.arena.BotRegistration\x1a\x1b.arena.RegistrationResponse\x12\x31\n\x08PlayGame\x12\r.arena.Action\x1a\x12.arena.Observation(\x01\x30\x01\x12/\n\tSendEvent\x12\x10.arena.GameEvent\x1a\x10.arena.GameEvent\x12\x34\n\x08GetStats\x12\x16.arena.BotRegistration\x1a\x10.arena.GameStatsb\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x0b\x61rena.proto\x12\x05\x61rena\"\x1c\n\x04Vec2\x12\t\n\x01x\x18\x01 \x01(\x02\x12\t\n\x01y\x18\x02 \x01(\x02\";\n\x04Rect\x12\t\n\x01x\x18\x01 \x01(\x02\x12\t\n\x01y\x18\x02 \x01(\x02\x12\r\n\x05width\x18\x03 \x01(\x02\x12\x0e\n\x06height\x18\x04 \x01(\x02\"\xf0\x01\n\x0bObservation\x12\x0c\n\x04tick\x18\x01 \x01(\r\x12\x1d\n\x08self_pos\x18\x02 \x01(\x0b\x32\x0b.arena.Vec2\x12\x0f\n\x07self_hp\x18\x03 \x01(\x02\x12\x1e\n\tenemy_pos\x18\x04 \x01(\x0b\x32\x0b.arena.Vec2\x12\x10\n\x08\x65nemy_hp\x18\x05 \x01(\x02\x12\x1c\n\x07\x62ullets\x18\x06 \x03(\x0b\x32\x0b.arena.Vec2\x12\r\n\x05walls\x18\x07 \x03(\x02\x12\x19\n\x11has_line_of_sight\x18\x08 \x01(\x08\x12\x13\n\x0b\x61rena_width\x18\t \x01(\x02\x12\x14\n\x0c\x61rena_height\x18\n \x01(\x02\"F\n\x06\x41\x63tion\x12\x1b\n\x06thrust\x18\x01 \x01(\x0b\x32\x0b.arena.Vec2\x12\x11\n\taim_angle\x18\x02 \x01(\x02\x12\x0c\n\x04\x66ire\x18\x03 \x01(\x08\"^\n\x0f\x42otRegistration\x12\x11\n\tplayer_id\x18\x01 \x01(\t\x12\x10\n\x08\x62ot_name\x18\x02 \x01(\t\x12\x0f\n\x07room_id\x18\x03 \x01(\t\x12\x15\n\rroom_password\x18\x04 \x01(\t\"H\n\x14RegistrationResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x0e\n\x06\x62ot_id\x18\x03 \x01(\x05\"_\n\tGameEvent\x12\x0c\n\x04type\x18\x01 \x01(\t\x12\x0e\n\x06\x62ot_id\x18\x02 \x01(\x05\x12\x0e\n\x06reward\x18\x03 \x01(\x02\x12\x0c\n\x04\x64one\x18\x04 \x01(\x08\x12\x16\n\x0erelated_bot_id\x18\x05 \x01(\x05\"\x85\x01\n\tGameStats\x12\x13\n\x0btotal_kills\x18\x01 \x01(\x05\x12\x14\n\x0ctotal_deaths\x18\x02 \x01(\x05\x12\x18\n\x10kill_death_ratio\x18\x03 \x01(\x02\x12\x14\n\x0cgames_played\x18\x04 \x01(\x05\x12\x1d\n\x15\x61verage_survival_time\x18\x05 \x01(\x02\x32\xf2\x01\n\x12\x41renaBattleService\x12\x42\n\x0bRegisterBot\x12\x16.arena.BotRegistration\x1a\x1b.arena.RegistrationResponse\x12\x31\n\x08PlayGame\x12\r.arena.Action\x1a\x12.arena.Observation(\x01\x30\x01\x12/\n\tSendEvent\x12\x10.arena.GameEvent\x1a\x10.arena.GameEvent\x12\x34\n\x08GetStats\x12\x16.arena.BotRegistration\x1a\x10.arena.GameStatsb\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -40,13 +40,13 @@ if not _descriptor._USE_C_DESCRIPTORS:
   _globals['_ACTION']._serialized_start=356
   _globals['_ACTION']._serialized_end=426
   _globals['_BOTREGISTRATION']._serialized_start=428
-  _globals['_BOTREGISTRATION']._serialized_end=482
-  _globals['_REGISTRATIONRESPONSE']._serialized_start=484
-  _globals['_REGISTRATIONRESPONSE']._serialized_end=556
-  _globals['_GAMEEVENT']._serialized_start=558
-  _globals['_GAMEEVENT']._serialized_end=653
-  _globals['_GAMESTATS']._serialized_start=656
-  _globals['_GAMESTATS']._serialized_end=789
-  _globals['_ARENABATTLESERVICE']._serialized_start=792
-  _globals['_ARENABATTLESERVICE']._serialized_end=1034
+  _globals['_BOTREGISTRATION']._serialized_end=522
+  _globals['_REGISTRATIONRESPONSE']._serialized_start=524
+  _globals['_REGISTRATIONRESPONSE']._serialized_end=596
+  _globals['_GAMEEVENT']._serialized_start=598
+  _globals['_GAMEEVENT']._serialized_end=693
+  _globals['_GAMESTATS']._serialized_start=696
+  _globals['_GAMESTATS']._serialized_end=829
+  _globals['_ARENABATTLESERVICE']._serialized_start=832
+  _globals['_ARENABATTLESERVICE']._serialized_end=1074
 # @@protoc_insertion_point(module_scope)
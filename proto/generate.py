@@ -0,0 +1,67 @@
+# proto/generate.py
+# Generate arena_pb2.py / arena_pb2_grpc.py from arena.proto
+# Usage: python proto/generate.py [--force]
+
+import hashlib
+import sys
+from pathlib import Path
+
+PROTO_DIR = Path(__file__).resolve().parent
+PROTO_FILE = PROTO_DIR / "arena.proto"
+GENERATED_FILES = [PROTO_DIR / "arena_pb2.py", PROTO_DIR / "arena_pb2_grpc.py"]
+# sha256 of the arena.proto the outputs were generated from (mtimes are unreliable after git checkout)
+STAMP_FILE = PROTO_DIR / ".arena.proto.sha256"
+
+
+def _proto_hash():
+    return hashlib.sha256(PROTO_FILE.read_bytes()).hexdigest()
+
+
+def _fix_grpc_import():
+    """protoc emits `import arena_pb2`; the package needs a relative import"""
+    grpc_file = PROTO_DIR / "arena_pb2_grpc.py"
+    source = grpc_file.read_text(encoding="utf-8")
+    fixed = source.replace("\nimport arena_pb2 as arena__pb2", "\nfrom . import arena_pb2 as arena__pb2")
+    if fixed != source:
+        grpc_file.write_text(fixed, encoding="utf-8")
+
+
+def _is_up_to_date():
+    """True if every generated file exists and was generated by this script from the current arena.proto"""
+    if not STAMP_FILE.exists() or not all(f.exists() for f in GENERATED_FILES):
+        return False
+    return STAMP_FILE.read_text(encoding="utf-8").strip() == _proto_hash()
+
+
+def main(force=False):
+    if not force and _is_up_to_date():
+        print("✅ Generated files are up to date (use --force to regenerate)")
+        return 0
+
+    try:
+        from grpc_tools import protoc
+    except ImportError:
+        print("❌ grpcio-tools not installed! Run: pip install grpcio-tools")
+        return 1
+
+    # Run protoc in-process (no extra interpreter startup)
+    args = [
+        "grpc_tools.protoc",
+        f"--proto_path={PROTO_DIR}",
+        f"--python_out={PROTO_DIR}",
+        f"--grpc_python_out={PROTO_DIR}",
+        str(PROTO_FILE),
+    ]
+    rc = protoc.main(args)
+    if rc != 0:
+        print(f"❌ protoc failed with exit code {rc}")
+        return rc
+
+    _fix_grpc_import()
+    STAMP_FILE.write_text(_proto_hash() + "\n", encoding="utf-8")
+    print(f"✅ Generated: {', '.join(f.name for f in GENERATED_FILES)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(force="--force" in sys.argv[1:]))